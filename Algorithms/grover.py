@@ -1,11 +1,29 @@
 import numpy as np
 
 from Structures.Registers import QuantumRegister
-from Structures.Gate import Gate_H
 from Structures.Diffusions import StandardDiffusion
 from Structures.Oracle import Oracle
 
-def run_grover(oracle : Oracle) -> int:
+
+def optimal_iterations(n: int, num_solutions: int) -> int:
+    """
+    Вычисляет оптимальное число итераций Гровера:
+        m = floor(pi / 4 * sqrt(2^n / t)),
+    где t - число решений f(x) = 1.
+
+    Параметры:
+        n (int): число кубитов.
+        num_solutions (int): число решений t.
+
+    Возвращает:
+        int: число итераций m (0, если решений нет).
+    """
+    if num_solutions == 0:
+        return 0
+    return int(np.floor(np.pi / 4 * np.sqrt(2 ** n / num_solutions)))
+
+
+def run_grover(oracle : Oracle, num_iterations: int = None, backend: str = "numpy") -> int:
     """
     Выполняет алгоритм Гровера для поиска решения задачи вида f(x) = 1,
     используя только линейную алгебру.
@@ -13,32 +31,35 @@ def run_grover(oracle : Oracle) -> int:
     Алгоритм выполняет следующие шаги:
     1. Инициализирует квантовый регистр в состоянии |00...0>.
     2. Применяет оператор Адамара к каждому кубиту (формирует суперпозицию).
-    3. Применяет оракул, отражающий амплитуду целевых состояний.
-    4. Применяет диффузионный оператор (отражение относительно средней амплитуды).
-    5. Измеряет состояние регистра и возвращает результат в виде числа x.
+    3. Повторяет m раз итерацию Гровера:
+       a. применяет оракул, отражающий амплитуду целевых состояний;
+       b. применяет диффузионный оператор (отражение относительно средней амплитуды).
+    4. Измеряет состояние регистра и возвращает результат в виде числа x.
 
     Параметры:
-        oracle (Oracle): объект оракула, реализующий метод to_gate(),
-                         возвращающий матрицу унитарного преобразования.
+        oracle (Oracle): объект оракула на oracle.n кубитах, реализующий
+                         методы get_diagonal() и apply().
+        num_iterations (int): число итераций m. По умолчанию
+                         m = floor(pi / 4 * sqrt(2^n / t)), где t - число
+                         отрицательных элементов на диагонали оракула.
+        backend (str): "numpy" (по умолчанию) или "cupy" - выполнять
+                         вычисления над вектором состояния на GPU.
 
     Возвращает:
         int: число x от 0 до 2**n - 1, где f(x) = 1 с высокой вероятностью.
     """
-    oracle_gate = oracle.to_gate()
-    n = int(np.log2(oracle_gate.gate_matrix.shape[0]))
-    reg = QuantumRegister(n)
+    n = oracle.n
+    # Амплитуды в алгоритме Гровера остаются вещественными на всех шагах
+    reg = QuantumRegister(n, dtype=np.float32, backend=backend)
 
-    h = Gate_H()
-    h_total = h
-    for _ in range(n - 1):
-        h_total = h_total.tensor(h)
-    reg.apply_gate(h_total.gate_matrix)
+    if num_iterations is None:
+        num_solutions = int(np.count_nonzero(oracle.get_diagonal() < 0))
+        num_iterations = optimal_iterations(n, num_solutions)
 
-    reg.apply_gate(oracle_gate.gate_matrix)
-
-    diffusion = StandardDiffusion(n)
-    reg.apply_gate(diffusion.to_gate().gate_matrix)
+    reg.apply_hadamard_all()
 
+    diffusion = StandardDiffusion(n, dtype=np.float32)
+    for _ in range(num_iterations):
+        reg.apply_grover_iteration(oracle, diffusion)
 
     return reg.measure()
-
@@ -1,4 +1,3 @@
-import numpy as np
 import matplotlib.pyplot as plt
 from Structures.Gate import Gate_H
 from Structures.Oracle import OracleAND
@@ -17,20 +16,21 @@ def analyze_probability(max_iterations=5, verbose=True):
 
     reg = QuantumRegister(2)
 
-    # Применяем H ⊗ H
-    H2 = h_gate.tensor(h_gate)
-    reg.apply_gate(H2.gate_matrix)
+    # Применяем H к каждому кубиту (H ⊗ H)
+    for target in range(2):
+        reg.apply_single_qubit_gate(h_gate.gate_matrix, target)
 
     results = []
     for i in range(max_iterations + 1):
-        prob = np.abs(reg.get_state()[3, 0]) ** 2  # вероятность |11⟩
+        amplitude = reg.get_state()[3]
+        prob = amplitude.real ** 2 + amplitude.imag ** 2  # вероятность |11⟩
         results.append(prob)
         if verbose:
             print(f"Итерация {i}: вероятность |11⟩ = {prob:.4f}")
 
         # Один шаг Гровера: оракул + диффузия
-        reg.apply_gate(oracle.get_matrix())
-        reg.apply_gate(diffuser.get_matrix())
+        reg.apply_operator(oracle)
+        reg.apply_operator(diffuser)
 
     return results
 
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import numpy as np
 from numpy import ndarray
 
 from Structures.Gate import GenericGate
+from Structures._backend import get_array_module
 
 
 class Diffusion(ABC):
@@ -26,6 +28,22 @@ class Diffusion(ABC):
         """
         pass
 
+    @abstractmethod
+    def apply(self, state: ndarray) -> ndarray:
+        """
+        Применяет диффузионный оператор к вектору состояния на месте,
+        не строя матрицу оператора.
+
+        Метод должен быть реализован в наследуемом классе.
+
+        Parameters:
+            state (ndarray): вектор амплитуд длины 2^n (изменяется на месте).
+
+        Returns:
+            ndarray: тот же массив state после применения оператора.
+        """
+        pass
+
     @abstractmethod
     def to_gate(self) -> GenericGate:
         """
@@ -50,14 +68,18 @@ class GenericDiffusion(Diffusion):
     для конкретной реализации отражения.
     """
 
-    def __init__(self, num_qubits: int):
+    def __init__(self, num_qubits: int, dtype=complex):
         """
         Инициализирует объект для построения диффузионного оператора.
 
         Parameters:
             num_qubits (int): число кубитов в регистре.
+            dtype: тип элементов (по умолчанию complex; для алгоритма Гровера
+                   достаточно вещественного np.float32).
         """
         self.n = num_qubits
+        self.size = 1 << num_qubits
+        self.dtype = dtype
 
     @abstractmethod
     def get_psi(self) -> ndarray:
@@ -77,14 +99,62 @@ class GenericDiffusion(Diffusion):
             D = 2 * psi * psi^dagger - I
 
         Returns:
-            ndarray: квадратная комплексная матрица 2^n на 2^n.
+            ndarray: квадратная матрица 2^n на 2^n типа dtype.
         """
-        size = 2 ** self.n
         psi = self.get_psi()
         projector = 2 * (psi @ psi.T.conj())
-        identity = np.eye(size, dtype=complex)
+        identity = np.eye(self.size, dtype=self.dtype)
         return projector - identity
 
+    def apply(self, state: ndarray) -> ndarray:
+        """
+        Применяет отражение относительно psi без построения матрицы D,
+        используя то, что D - проектор ранга 1 за вычетом единицы:
+            state' = 2 * psi * (psi^dagger * state) - state
+
+        Требует одного скалярного произведения и одного сложения, O(2^n).
+
+        Для вещественного state и вещественного (по значениям) psi результат
+        остаётся вещественным и записывается на месте. Если psi имеет
+        ненулевую мнимую часть, вещественный state, как и в apply_gate,
+        расширяется до комплексного типа, и возвращается новый массив.
+
+        Parameters:
+            state (ndarray): вектор амплитуд длины 2^n (изменяется на месте).
+
+        Returns:
+            ndarray: state после отражения (новый массив, если тип расширен).
+
+        Raises:
+            ValueError: если длина state не равна 2^n.
+        """
+        self._check_size(state)
+        xp = get_array_module(state)
+        psi = xp.asarray(self.get_psi().ravel())
+        if state.dtype.kind != "c" and psi.dtype.kind == "c":
+            if xp.any(psi.imag):
+                state = state.astype(np.result_type(state.dtype, psi.dtype))
+            else:
+                psi = psi.real
+        psi = psi.astype(state.dtype, copy=False)
+        overlap = xp.vdot(psi, state)
+        xp.negative(state, out=state)
+        state += (2 * overlap) * psi
+        return state
+
+    def _check_size(self, state: ndarray) -> None:
+        """
+        Проверяет, что длина state равна 2^n. Быстрые ядра, в отличие от
+        умножения на матрицу, сами несовпадение размеров не обнаруживают.
+
+        Raises:
+            ValueError: если длина state не равна 2^n.
+        """
+        if state.shape[0] != self.size:
+            raise ValueError(
+                f"Диффузию на {self.n} кубитах нельзя применить к состоянию длины {state.shape[0]}."
+            )
+
     def to_gate(self) -> GenericGate:
         """
         Преобразует построенную матрицу диффузии в объект GenericGate.
@@ -103,14 +173,16 @@ class StandardDiffusion(GenericDiffusion):
         psi = (1 / sqrt(2^n)) * [1, 1, ..., 1]^T
     """
 
-    def __init__(self, num_qubits: int):
+    def __init__(self, num_qubits: int, dtype=complex):
         """
         Инициализирует стандартный диффузионный оператор.
 
         Parameters:
             num_qubits (int): число кубитов в регистре.
+            dtype: тип элементов (по умолчанию complex; для алгоритма Гровера
+                   достаточно вещественного np.float32).
         """
-        super().__init__(num_qubits)
+        super().__init__(num_qubits, dtype)
 
     def get_psi(self) -> ndarray:
         """
@@ -119,5 +191,50 @@ class StandardDiffusion(GenericDiffusion):
         Returns:
             ndarray: вектор размера 2^n на 1 с элементами (1 / sqrt(2^n)).
         """
-        size = 2 ** self.n
-        return np.ones((size, 1), dtype=complex) / np.sqrt(size)
+        return np.full((self.size, 1), 1 / np.sqrt(self.size), dtype=self.dtype)
+
+    def get_matrix(self) -> ndarray:
+        """
+        Возвращает матрицу стандартного диффузионного оператора
+            D = 2 * psi * psi^dagger - I.
+
+        Матрица строится один раз для каждого n и берётся из кэша.
+
+        Returns:
+            ndarray: квадратная матрица 2^n на 2^n типа dtype (только для чтения).
+        """
+        return _cached_uniform_diffuser(self.n, np.dtype(self.dtype))
+
+    def apply(self, state: ndarray) -> ndarray:
+        """
+        Применяет стандартный диффузионный оператор к вектору состояния на месте,
+        не строя матрицу 2^n на 2^n (инверсия относительно среднего):
+            v' = 2 * mean(v) - v
+
+        Parameters:
+            state (ndarray): вектор амплитуд длины 2^n (изменяется на месте).
+
+        Returns:
+            ndarray: тот же массив state после отражения.
+
+        Raises:
+            ValueError: если длина state не равна 2^n.
+        """
+        self._check_size(state)
+        xp = get_array_module(state)
+        mean = xp.mean(state)
+        xp.subtract(2 * mean, state, out=state)
+        return state
+
+
+@lru_cache(maxsize=16)
+def _cached_uniform_diffuser(n: int, dtype: np.dtype) -> ndarray:
+    """
+    Строит и кэширует матрицу стандартной диффузии для n кубитов и типа dtype.
+
+    Возвращаемый массив доступен только для чтения, так как
+    разделяется между всеми вызовами.
+    """
+    matrix = GenericDiffusion.get_matrix(StandardDiffusion(n, dtype))
+    matrix.setflags(write=False)
+    return matrix
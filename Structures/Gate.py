@@ -4,6 +4,29 @@ from numpy import ndarray
 
 from Structures.Qubit import Qubit
 
+# Матрицы однокубитных гейтов строятся один раз при загрузке модуля
+# и разделяются всеми экземплярами, поэтому доступны только для чтения.
+_X_MATRIX = np.array([[0, 1],
+                      [1, 0]], dtype=complex)
+_H_MATRIX = (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex)
+_Z_MATRIX = np.array([[1, 0],
+                      [0, -1]], dtype=complex)
+for _matrix in (_X_MATRIX, _H_MATRIX, _Z_MATRIX):
+    _matrix.setflags(write=False)
+del _matrix
+
+
+def _as_dtype(matrix: ndarray, dtype) -> ndarray:
+    """
+    Приводит вещественную по смыслу константную матрицу гейта к типу dtype.
+
+    Для комплексного типа возвращается сама константа без копирования,
+    для вещественного - её действительная часть.
+    """
+    if not np.issubdtype(np.dtype(dtype), np.complexfloating):
+        matrix = matrix.real
+    return matrix.astype(dtype, copy=False)
+
 
 class Gate(ABC):
     """
@@ -79,14 +102,20 @@ class GenericGate(Gate):
     тензорное произведение, проверку унитарности и композицию.
     """
 
-    def __init__(self, gate_matrix: ndarray):
+    def __init__(self, gate_matrix: ndarray, skip_checks: bool = True):
         """
         Инициализирует гейт с заданной матрицей.
 
         Parameters:
             gate_matrix (ndarray): унитарная матрица гейта.
+            skip_checks (bool): если False - проверяет унитарность матрицы
+                                (O(N^3)) и выбрасывает ValueError при нарушении.
         """
         super().__init__(gate_matrix)
+        self._checked_matrix = None
+        self._unitary = False
+        if not skip_checks and not self.is_unitary():
+            raise ValueError("Матрица гейта не является унитарной.")
 
     def apply_to(self, qubit: Qubit) -> Qubit:
         """
@@ -95,7 +124,7 @@ class GenericGate(Gate):
         Returns:
             Qubit: результат действия гейта.
         """
-        return Qubit(self.gate_matrix @ qubit.get_state())
+        return Qubit(self.gate_matrix @ qubit.get_state(), _skip_normalize=True)
 
     def tensor(self, other_gate: "Gate") -> "Gate":
         """
@@ -110,12 +139,20 @@ class GenericGate(Gate):
         """
         Проверяет унитарность матрицы гейта.
 
+        Проверка стоит O(N^3), поэтому не вызывается в алгоритмах и
+        выполняется не более одного раза для каждого объекта gate_matrix:
+        результат кэшируется до замены матрицы (изменение матрицы
+        на месте кэш не сбрасывает).
+
         Returns:
             bool: True, если унитарна.
         """
-        identity = np.eye(self.gate_matrix.shape[0], dtype=complex)
-        product = self.gate_matrix.conj().T @ self.gate_matrix
-        return np.allclose(product, identity)
+        if self._checked_matrix is not self.gate_matrix:
+            identity = np.eye(self.gate_matrix.shape[0], dtype=complex)
+            product = self.gate_matrix.conj().T @ self.gate_matrix
+            self._unitary = bool(np.allclose(product, identity))
+            self._checked_matrix = self.gate_matrix
+        return self._unitary
 
     def __matmul__(self, other: "Gate") -> "Gate":
         """
@@ -132,10 +169,8 @@ class Gate_X(GenericGate):
     Гейт Паули-X. Переводит |0> в |1> и |1> в |0> (аналог классического NOT).
     """
 
-    def __init__(self):
-        x_matrix = np.array([[0, 1],
-                             [1, 0]], dtype=complex)
-        super().__init__(x_matrix)
+    def __init__(self, dtype=complex):
+        super().__init__(_as_dtype(_X_MATRIX, dtype))
 
 
 class Gate_H(GenericGate):
@@ -143,9 +178,8 @@ class Gate_H(GenericGate):
     Гейт Адамара. Переводит базисные состояния в суперпозиции.
     """
 
-    def __init__(self):
-        h_matrix = (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex)
-        super().__init__(h_matrix)
+    def __init__(self, dtype=complex):
+        super().__init__(_as_dtype(_H_MATRIX, dtype))
 
     def superposition(self) -> Qubit:
         """
@@ -163,7 +197,5 @@ class Gate_Z(GenericGate):
     Гейт Паули-Z. Меняет знак у амплитуды состояния |1>, оставляя |0> без изменений.
     """
 
-    def __init__(self):
-        z_matrix = np.array([[1, 0],
-                             [0, -1]], dtype=complex)
-        super().__init__(z_matrix)
+    def __init__(self, dtype=complex):
+        super().__init__(_as_dtype(_Z_MATRIX, dtype))
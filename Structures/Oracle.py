@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 import numpy as np
 from numpy import ndarray
 from Structures.Gate import GenericGate
+from Structures._backend import get_array_module
 
 
 class Oracle(ABC):
@@ -23,6 +24,29 @@ class Oracle(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_diagonal(self) -> ndarray:
+        """
+        Возвращает диагональ матрицы оракула U_f - вектор из +1 и -1.
+
+        Returns:
+            ndarray: вектор длины 2^n, элемент i которого равен (-1)^f(i).
+        """
+        pass
+
+    @abstractmethod
+    def apply(self, state: ndarray) -> ndarray:
+        """
+        Применяет оракул к вектору состояния на месте, не строя матрицу U_f.
+
+        Parameters:
+            state (ndarray): вектор амплитуд длины 2^n (изменяется на месте).
+
+        Returns:
+            ndarray: тот же массив state после применения оракула.
+        """
+        pass
+
     @abstractmethod
     def get_function(self):
         """
@@ -52,14 +76,19 @@ class GenericOracle(Oracle):
     Использует диагональную матрицу, где элемент с индексом i равен (-1)^f(i).
     """
 
-    def __init__(self, n_qubits: int):
+    def __init__(self, n_qubits: int, dtype=complex):
         """
         Инициализирует оракул на n кубитах.
 
         Parameters:
             n_qubits (int): количество кубитов.
+            dtype: тип элементов матрицы оракула (по умолчанию complex).
         """
         self.n = n_qubits
+        self.size = 1 << n_qubits
+        self.dtype = dtype
+        self._diagonal = None
+        self._device_diagonal = None
 
     @abstractmethod
     def get_function(self):
@@ -71,18 +100,72 @@ class GenericOracle(Oracle):
         """
         pass
 
+    def get_diagonal(self) -> ndarray:
+        """
+        Возвращает диагональ матрицы оракула:
+            d = ((-1)^f(0), (-1)^f(1), ..., (-1)^f(2^n - 1))
+
+        Вектор вычисляется при первом вызове и кэшируется. Функция f
+        оборачивается в np.vectorize; наследники, у которых f записана
+        через операции NumPy, могут передать её в get_diagonal_vectorized()
+        напрямую.
+
+        Returns:
+            ndarray: вектор типа int8 длины 2^n из +1 и -1.
+        """
+        if self._diagonal is None:
+            f_vec = np.vectorize(self.get_function(), otypes=[np.int8])
+            self._diagonal = self.get_diagonal_vectorized(f_vec)
+        return self._diagonal
+
+    def get_diagonal_vectorized(self, f_vec) -> ndarray:
+        """
+        Строит диагональ оракула одним векторным выражением:
+            d = 1 - 2 * f_vec(arange(2^n))
+
+        Parameters:
+            f_vec (Callable[[ndarray], ndarray]): векторизованная функция f,
+                принимающая массив индексов и возвращающая массив из 0 и 1.
+
+        Returns:
+            ndarray: вектор типа int8 длины 2^n из +1 и -1.
+        """
+        idx = np.arange(self.size)
+        return 1 - 2 * np.asarray(f_vec(idx), dtype=np.int8)
+
+    def apply(self, state: ndarray) -> ndarray:
+        """
+        Применяет оракул как поэлементное умножение на диагональ U_f:
+            state[i] *= (-1)^f(i)
+
+        Parameters:
+            state (ndarray): вектор амплитуд длины 2^n (изменяется на месте).
+
+        Returns:
+            ndarray: тот же массив state после применения оракула.
+        """
+        xp = get_array_module(state)
+        diagonal = self.get_diagonal()
+        if xp is not np:
+            # Диагональ копируется на устройство один раз
+            if self._device_diagonal is None:
+                self._device_diagonal = xp.asarray(diagonal)
+            diagonal = self._device_diagonal
+        xp.multiply(state, diagonal, out=state)
+        return state
+
     def get_matrix(self) -> ndarray:
         """
         Строит диагональную матрицу оракула:
             U_f = diag((-1)^f(0), (-1)^f(1), ..., (-1)^f(2^n - 1))
 
+        Знаки берутся из get_diagonal(), где (-1)^f(i) вычисляется
+        без возведения в степень как 1 - 2 * f(i).
+
         Returns:
-            ndarray: комплексная диагональная матрица размера 2^n на 2^n.
+            ndarray: диагональная матрица размера 2^n на 2^n типа dtype.
         """
-        size = 2 ** self.n
-        f = self.get_function()
-        diag = [(-1) ** f(i) for i in range(size)]
-        return np.diag(diag).astype(complex)
+        return np.diag(self.get_diagonal()).astype(self.dtype)
 
     def to_gate(self) -> GenericGate:
         """
@@ -100,11 +183,14 @@ class OracleAND(GenericOracle):
     где x - двухбитное значение, представляемое числом от 0 до 3 (n = 2).
     """
 
-    def __init__(self):
+    def __init__(self, dtype=complex):
         """
         Инициализирует оракул на 2 кубитах для функции f(x) = (x >> 1) & 1 AND x & 1.
+
+        Parameters:
+            dtype: тип элементов матрицы оракула (по умолчанию complex).
         """
-        super().__init__(2)
+        super().__init__(2, dtype)
 
     def get_function(self):
         """
@@ -115,3 +201,37 @@ class OracleAND(GenericOracle):
             Callable[[int], int]: функция f(x), равная 1 только при x = 3.
         """
         return lambda x: ((x >> 1) & 1) & (x & 1)
+
+    def get_diagonal(self) -> ndarray:
+        """
+        Возвращает диагональ оракула, вычисленную без вызова Python-функции
+        для каждого индекса: f(x) = ((x >> 1) & 1) & (x & 1) применяется
+        сразу ко всему массиву индексов.
+
+        Returns:
+            ndarray: вектор [1, 1, 1, -1] типа int8.
+        """
+        if self._diagonal is None:
+            self._diagonal = self.get_diagonal_vectorized(self.get_function())
+        return self._diagonal
+
+    def apply(self, state: ndarray) -> ndarray:
+        """
+        Применяет оракул AND без матрицы и диагонали: f(x) = 1 только
+        при x = 3, поэтому достаточно инвертировать одну амплитуду.
+
+        Parameters:
+            state (ndarray): вектор амплитуд длины 4 (изменяется на месте).
+
+        Returns:
+            ndarray: тот же массив state после применения оракула.
+
+        Raises:
+            ValueError: если длина state не равна 4.
+        """
+        if state.shape[0] != self.size:
+            raise ValueError(
+                f"Оракул на {self.n} кубитах нельзя применить к состоянию длины {state.shape[0]}."
+            )
+        state[3] = -state[3]
+        return state
@@ -11,19 +11,24 @@ class Qubit:
         [alpha, beta]^T,
     где alpha и beta - комплексные амплитуды.
 
-    При инициализации автоматически выполняется нормализация вектора.
+    При инициализации автоматически выполняется нормализация вектора,
+    кроме результатов применения унитарных гейтов, которые норму сохраняют.
     """
 
-    def __init__(self, alfa_beta: ndarray) -> None:
+    def __init__(self, alfa_beta: ndarray, _skip_normalize: bool = False) -> None:
         """
         Инициализирует кубит по переданному вектору амплитуд.
 
         Parameters:
             alfa_beta (ndarray): массив из двух чисел (возможно вещественных),
                                  задающих амплитуды состояний |0> и |1>.
+            _skip_normalize (bool): служебный флаг - не нормализовать вектор,
+                                 если он заведомо нормирован (результат
+                                 применения унитарного гейта).
         """
         self.alfa_beta = alfa_beta.astype(complex)
-        self._normalize()
+        if not _skip_normalize:
+            self._normalize()
 
     def _normalize(self) -> None:
         """
@@ -34,6 +39,14 @@ class Qubit:
         if norm != 0:
             self.alfa_beta /= norm
 
+    def renormalize(self) -> None:
+        """
+        Повторно нормализует состояние. Применение гейтов не нормализует
+        результат, поэтому после длинной цепочки гейтов метод можно вызвать,
+        чтобы убрать накопленную ошибку округления.
+        """
+        self._normalize()
+
     def apply_gate(self, gate_matrix: ndarray) -> "Qubit":
         """
         Применяет квантовый гейт (матрицу 2 на 2) к текущему состоянию кубита.
@@ -44,7 +57,7 @@ class Qubit:
         Returns:
             Qubit: новый кубит с обновлённым состоянием.
         """
-        return Qubit(gate_matrix @ self.alfa_beta)
+        return Qubit(gate_matrix @ self.alfa_beta, _skip_normalize=True)
 
     def get_state(self) -> ndarray:
         """
@@ -2,6 +2,11 @@ from abc import ABC, abstractmethod
 import numpy as np
 from numpy import ndarray
 
+from Structures.Gate import GenericGate
+from Structures.Diffusions import Diffusion, StandardDiffusion
+from Structures.Oracle import Oracle
+from Structures import _backend, _kernels
+
 
 class Register(ABC):
     """
@@ -26,17 +31,18 @@ class Register(ABC):
         Возвращает текущее состояние квантового регистра.
 
         Returns:
-            ndarray: вектор-столбец комплексных амплитуд длины 2^n.
+            ndarray: одномерный вектор комплексных амплитуд длины 2^n.
         """
         pass
 
     @abstractmethod
-    def apply_gate(self, gate_matrix: ndarray) -> None:
+    def apply_gate(self, gate_matrix: ndarray, skip_checks: bool = True) -> None:
         """
         Применяет унитарный оператор (гейт) к текущему состоянию регистра.
 
         Parameters:
             gate_matrix (ndarray): квадратная унитарная матрица размера 2^n на 2^n.
+            skip_checks (bool): если False - предварительно проверяет унитарность.
         """
         pass
 
@@ -56,38 +62,85 @@ class GenericRegister(Register):
     """
     Базовая реализация квантового регистра.
 
-    Хранит состояние регистра в виде нормированного комплексного вектора
-    и реализует методы для применения гейтов и измерения.
+    Хранит состояние регистра в виде нормированного вектора (по умолчанию
+    комплексного) и реализует методы для применения гейтов и измерения.
     """
 
-    def __init__(self, num_qubits: int):
+    def __init__(self, num_qubits: int, dtype=complex, backend: str = "numpy"):
         """
         Инициализирует регистр на n кубитах и устанавливает начальное состояние |00...0>.
 
         Parameters:
             num_qubits (int): количество кубитов.
+            dtype: тип амплитуд (по умолчанию complex). Амплитуды в алгоритме
+                   Гровера остаются вещественными, поэтому для него достаточно
+                   np.float32 - вчетверо меньше памяти, чем complex128.
+            backend (str): "numpy" (по умолчанию) или "cupy" - хранить
+                   состояние на GPU; ядра регистра, оракулов и диффузий
+                   работают с массивами обоих модулей.
         """
         super().__init__(num_qubits)
-        self.state = np.zeros((2 ** num_qubits, 1), dtype=complex)
-        self.state[0][0] = 1  # начальное состояние - только |00...0> с амплитудой 1
+        self.xp = _backend.get_backend(backend)
+        self.state = self.xp.zeros(2 ** num_qubits, dtype=dtype)
+        self.state[0] = 1  # начальное состояние - только |00...0> с амплитудой 1
+        # Буфер для результата умножения на матрицу: после применения гейта
+        # state и _scratch меняются местами, и новые массивы не выделяются
+        self._scratch = self.xp.empty_like(self.state)
+        # Последняя проверенная матрица и её гейт: повторная проверка той же
+        # матрицы берёт результат из кэша GenericGate.is_unitary()
+        self._checked_matrix = None
+        self._checked_gate = None
 
     def get_state(self) -> ndarray:
         """
         Возвращает текущее состояние регистра.
 
         Returns:
-            ndarray: вектор амплитуд (размерность 2^n на 1).
+            ndarray: одномерный вектор амплитуд длины 2^n.
         """
         return self.state
 
-    def apply_gate(self, gate_matrix: ndarray) -> None:
+    def apply_gate(self, gate_matrix: ndarray, skip_checks: bool = True) -> None:
         """
         Применяет гейт к текущему состоянию регистра.
 
         Parameters:
             gate_matrix (ndarray): матрица квантового гейта размера 2^n на 2^n.
+            skip_checks (bool): если False - проверяет унитарность матрицы
+                                (O(N^3), только для отладки; матрица CuPy
+                                для проверки копируется в память CPU)
+                                и выбрасывает ValueError при нарушении.
+
+        Результат записывается в заранее выделенный буфер, поэтому массив,
+        ранее полученный через get_state(), может быть перезаписан.
+        """
+        if not skip_checks:
+            if self._checked_gate is None or self._checked_matrix is not gate_matrix:
+                self._checked_gate = GenericGate(_backend.to_numpy(gate_matrix))
+                self._checked_matrix = gate_matrix
+            if not self._checked_gate.is_unitary():
+                raise ValueError("Матрица гейта не является унитарной.")
+        gate_matrix = self.xp.asarray(gate_matrix)
+        if np.result_type(gate_matrix.dtype, self.state.dtype) != self.state.dtype:
+            # Матрица расширяет тип состояния (например, комплексный гейт
+            # для вещественного регистра) - результат в буфер не помещается
+            self.state = gate_matrix @ self.state
+            return
+        scratch = self._get_scratch()
+        self.xp.matmul(gate_matrix, self.state, out=scratch)
+        self._scratch, self.state = self.state, scratch
+
+    def _get_scratch(self) -> ndarray:
         """
-        self.state = gate_matrix @ self.state
+        Возвращает буфер той же формы и типа, что и state, выделяя его
+        заново только если state был заменён массивом другого вида.
+
+        Returns:
+            ndarray: буфер длины 2^n.
+        """
+        if self._scratch.shape != self.state.shape or self._scratch.dtype != self.state.dtype:
+            self._scratch = self.xp.empty_like(self.state)
+        return self._scratch
 
     def measure(self) -> int:
         """
@@ -97,8 +150,23 @@ class GenericRegister(Register):
             int: индекс одного из базисных состояний, выбранный согласно
                  распределению вероятностей по квадратам модулей амплитуд.
         """
-        probabilities = np.abs(self.state.flatten()) ** 2
-        return int(np.random.choice(len(probabilities), p=probabilities))
+        # |a|^2 = re^2 + im^2 без sqrt, который делает np.abs; для вещественного
+        # состояния мнимая часть не нужна (state.imag выделил бы массив нулей)
+        s = self.state
+        if s.dtype.kind == "c":
+            probabilities = s.real * s.real + s.imag * s.imag
+        else:
+            probabilities = s * s
+        cdf = self.xp.cumsum(probabilities)
+        # Нормировка на cdf[-1] поглощает ошибку округления в сумме вероятностей;
+        # порог считается в float64, иначе для float32 он округляется до cdf[-1]
+        total = float(cdf[-1])
+        target = self.xp.random.random() * total
+        index = int(self.xp.searchsorted(cdf, target, side="right"))
+        # Если порог всё же совпал с cdf[-1], берём последнее состояние
+        # с ненулевой вероятностью
+        last = int(self.xp.searchsorted(cdf, cdf[-1], side="left"))
+        return min(index, last)
 
 
 class QuantumRegister(GenericRegister):
@@ -109,11 +177,119 @@ class QuantumRegister(GenericRegister):
     экземпляр регистра в алгоритмах (например, Гровера).
     """
 
-    def __init__(self, num_qubits: int):
+    def __init__(self, num_qubits: int, dtype=complex, backend: str = "numpy"):
         """
         Инициализирует квантовый регистр с заданным числом кубитов.
 
         Parameters:
             num_qubits (int): количество кубитов.
+            dtype: тип амплитуд (по умолчанию complex).
+            backend (str): "numpy" (по умолчанию) или "cupy".
         """
-        super().__init__(num_qubits)
+        super().__init__(num_qubits, dtype, backend)
+
+    def apply_operator(self, op) -> None:
+        """
+        Применяет оператор к текущему состоянию регистра, выбирая
+        специализированное ядро, если оно есть.
+
+        Диффузия применяется как отражение ранга 1 (для стандартной - инверсия
+        относительно среднего), а оракул - как поэлементное умножение на свою
+        диагональ; оба ядра работают за O(2^n) без построения плотной матрицы.
+        Для остальных операторов используется умножение на матрицу.
+
+        Parameters:
+            op (Diffusion | Oracle | GenericGate | ndarray): оператор
+                или матрица размера 2^n на 2^n.
+        """
+        if isinstance(op, (Diffusion, Oracle)):
+            # apply() может вернуть новый массив, если тип состояния расширен
+            self.state = op.apply(self.state)
+        elif isinstance(op, GenericGate):
+            self.apply_gate(op.gate_matrix)
+        else:
+            self.apply_gate(op)
+
+    def apply_grover_iteration(self, oracle: Oracle, diffusion: Diffusion) -> None:
+        """
+        Выполняет одну итерацию Гровера: оракул, затем диффузия.
+
+        Если установлена Numba, а диффузия стандартная, оба оператора
+        применяются одним скомпилированным ядром, которое читает и
+        записывает вектор состояния вдвое реже, чем два отдельных шага.
+
+        Parameters:
+            oracle (Oracle): оракул с диагональной матрицей.
+            diffusion (GenericDiffusion): диффузионный оператор.
+
+        Raises:
+            ValueError: если оракул или диффузия построены для другого
+                        числа кубитов, чем регистр (ядро Numba не проверяет
+                        границы массивов).
+        """
+        diagonal = oracle.get_diagonal()
+        if diagonal.shape != self.state.shape:
+            raise ValueError(
+                f"Оракул с диагональю длины {diagonal.shape[0]} нельзя применить "
+                f"к регистру из {self.num_qubits} кубитов."
+            )
+        if diffusion.n != self.num_qubits:
+            raise ValueError(
+                f"Диффузию на {diffusion.n} кубитах нельзя применить "
+                f"к регистру из {self.num_qubits} кубитов."
+            )
+
+        if (_kernels.HAS_NUMBA and self.xp is np and self.state.flags.c_contiguous
+                and isinstance(diffusion, StandardDiffusion)):
+            _kernels.grover_iterate(self.state, diagonal)
+            return
+
+        self.apply_operator(oracle)
+        self.apply_operator(diffusion)
+
+    def apply_hadamard_all(self) -> None:
+        """
+        Применяет гейт Адамара к каждому кубиту (H^{⊗n}) на месте
+        быстрым преобразованием Уолша-Адамара за O(n * 2^n).
+
+        На каждом шаге вектор разбивается на блоки длины 2h, и половины
+        каждого блока (x, y) заменяются на (x + y, x - y); все блоки
+        шага обрабатываются одной векторной операцией NumPy. Если установлена
+        Numba, используется скомпилированное параллельное ядро.
+        """
+        state = self.state
+        if _kernels.HAS_NUMBA and self.xp is np and state.flags.c_contiguous:
+            _kernels.fwht_inplace(state)
+            return
+
+        size = state.shape[0]
+        scratch = self._get_scratch()
+        h = 1
+        while h < size:
+            blocks = state.reshape(-1, 2, h)
+            x = scratch[:size // 2].reshape(-1, h)
+            x[...] = blocks[:, 0, :]
+            y = blocks[:, 1, :]
+            blocks[:, 0, :] += y
+            self.xp.subtract(x, y, out=y)
+            h *= 2
+        state *= 1 / np.sqrt(size)
+
+    def apply_single_qubit_gate(self, gate_matrix: ndarray, target: int) -> None:
+        """
+        Применяет однокубитный гейт к кубиту target, не строя матрицу
+        I ⊗ ... ⊗ G ⊗ ... ⊗ I размера 2^n на 2^n.
+
+        Состояние рассматривается как тензор формы (2, 2, ..., 2), и гейт
+        свёртывается с осью target за O(2^n). Нумерация кубитов совпадает
+        с порядком множителей в np.kron: кубит 0 - старший бит индекса.
+
+        Parameters:
+            gate_matrix (ndarray): матрица гейта размера 2 на 2.
+            target (int): номер кубита от 0 до n - 1.
+        """
+        tensor = self.state.reshape((2,) * self.num_qubits)
+        gate_matrix = self.xp.asarray(gate_matrix)
+        tensor = self.xp.tensordot(gate_matrix, tensor, axes=([1], [target]))
+        tensor = self.xp.moveaxis(tensor, 0, target)
+        self.state = tensor.ravel()
@@ -0,0 +1,64 @@
+"""
+Выбор модуля массивов (NumPy или CuPy) для хранения вектора состояния.
+
+CuPy - необязательная зависимость: если она не установлена,
+HAS_CUPY равен False, и доступен только backend "numpy".
+"""
+import numpy as np
+from numpy import ndarray
+
+try:
+    import cupy
+    HAS_CUPY = True
+except ImportError:
+    cupy = None
+    HAS_CUPY = False
+
+
+def get_backend(backend: str):
+    """
+    Возвращает модуль массивов по имени backend.
+
+    Parameters:
+        backend (str): "numpy" или "cupy".
+
+    Returns:
+        module: numpy или cupy.
+    """
+    if backend == "numpy":
+        return np
+    if backend == "cupy":
+        if not HAS_CUPY:
+            raise ImportError("Для backend='cupy' требуется установленный пакет CuPy.")
+        return cupy
+    raise ValueError(f"Неизвестный backend: {backend!r}. Допустимо 'numpy' или 'cupy'.")
+
+
+def get_array_module(array: ndarray):
+    """
+    Возвращает модуль (numpy или cupy), которому принадлежит массив.
+
+    Parameters:
+        array (ndarray): массив NumPy или CuPy.
+
+    Returns:
+        module: numpy или cupy.
+    """
+    if HAS_CUPY:
+        return cupy.get_array_module(array)
+    return np
+
+
+def to_numpy(array: ndarray) -> ndarray:
+    """
+    Возвращает копию массива в памяти CPU (массив NumPy возвращается как есть).
+
+    Parameters:
+        array (ndarray): массив NumPy или CuPy.
+
+    Returns:
+        ndarray: массив NumPy.
+    """
+    if HAS_CUPY and cupy.get_array_module(array) is cupy:
+        return cupy.asnumpy(array)
+    return np.asarray(array)
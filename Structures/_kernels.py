@@ -0,0 +1,62 @@
+"""
+Вычислительные ядра симулятора, скомпилированные Numba.
+
+Numba - необязательная зависимость: если она не установлена,
+HAS_NUMBA равен False, и регистр использует реализации на NumPy.
+"""
+import numpy as np
+from numpy import ndarray
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def fwht_inplace(state: ndarray) -> None:
+        """
+        Быстрое преобразование Уолша-Адамара (H^{⊗n}) на месте.
+
+        На каждом шаге h пары (i, i + h) независимы, поэтому внешний цикл
+        по парам распараллеливается, а сложение/вычитание векторизуется LLVM.
+
+        Parameters:
+            state (ndarray): одномерный непрерывный вектор длины 2^n.
+        """
+        size = state.shape[0]
+        h = 1
+        while h < size:
+            for k in prange(size // 2):
+                i = (k // h) * 2 * h + k % h
+                j = i + h
+                a = state[i]
+                b = state[j]
+                state[i] = a + b
+                state[j] = a - b
+            h *= 2
+        norm = 1 / np.sqrt(size)
+        for i in prange(size):
+            state[i] *= norm
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def grover_iterate(state: ndarray, oracle_diag: ndarray) -> None:
+        """
+        Одна итерация Гровера (диагональный оракул + стандартная диффузия)
+        на месте за два прохода по вектору вместо четырёх:
+            s = sum(d * v),  v' = 2 * s / N - d * v
+
+        Parameters:
+            state (ndarray): одномерный непрерывный вектор длины 2^n.
+            oracle_diag (ndarray): диагональ оракула из +1 и -1.
+        """
+        size = state.shape[0]
+        total = state[0] * 0.0
+        for i in prange(size):
+            total += oracle_diag[i] * state[i]
+        mean2 = 2 * total / size
+        for i in prange(size):
+            state[i] = mean2 - oracle_diag[i] * state[i]
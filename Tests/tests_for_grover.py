@@ -1,8 +1,12 @@
-from Structures.Gate import Gate_H
+from unittest import mock
+
+from Structures import _backend, _kernels
+from Structures.Gate import GenericGate, Gate_H, Gate_X
 import numpy as np
-from Structures.Oracle import OracleAND
+from Structures.Qubit import Qubit
+from Structures.Oracle import GenericOracle, OracleAND
 from Structures.Registers import QuantumRegister
-from Structures.Diffusions import StandardDiffusion
+from Structures.Diffusions import GenericDiffusion, StandardDiffusion
 from Algorithms.grover import run_grover
 
 
@@ -22,16 +26,120 @@ def test_superposition(verbose=True):
     reg = QuantumRegister(2)
     reg.apply_gate(h2.gate_matrix)
     result = reg.get_state()
-    expected = np.ones((4, 1), dtype=complex) / 2
+    expected = np.ones(4, dtype=complex) / 2
 
     if verbose:
         print("Результат применения H⊗H к |00>:")
-        for i, a in enumerate(result.flatten()):
+        for i, a in enumerate(result):
             print(f"  |{i:02b}>: амплитуда = {a.real:.2f} + {a.imag:.2f}j")
 
     assert np.allclose(result, expected), "Ошибка: суперпозиция H⊗H построена неверно."
 
 
+def test_hadamard_all(verbose=True):
+    """
+    Проверяет, что быстрое преобразование Уолша-Адамара apply_hadamard_all()
+    совпадает с применением матрицы H ⊗ H ⊗ H к произвольному состоянию
+    (типы complex и float32) - как ядром Numba, так и векторным
+    вариантом на NumPy.
+
+    Parameters:
+        verbose (bool): если True - выводит амплитуды после преобразования.
+    """
+    h = Gate_H()
+    h3 = h.tensor(h).tensor(h)
+
+    branches = [("NumPy", False)]
+    if _kernels.HAS_NUMBA:
+        branches.insert(0, ("Numba", True))
+
+    for name, use_numba in branches:
+        with mock.patch.object(_kernels, "HAS_NUMBA", use_numba):
+            for dtype in (complex, np.float32):
+                reg = QuantumRegister(3, dtype)
+                reg.state[:] = np.arange(8) / np.sqrt(140)
+                expected = h3.gate_matrix @ reg.get_state()
+                reg.apply_hadamard_all()
+                result = reg.get_state()
+
+                if verbose and dtype is complex:
+                    print(f"Результат преобразования Уолша-Адамара ({name}):")
+                    for i, a in enumerate(result):
+                        print(f"  |{i:03b}>: амплитуда = {a.real:.2f} + {a.imag:.2f}j")
+
+                assert result.dtype == np.dtype(dtype), \
+                    f"Ошибка: преобразование Уолша-Адамара ({name}) изменило тип состояния."
+                assert np.allclose(result, expected, atol=1e-6), \
+                    f"Ошибка: преобразование Уолша-Адамара ({name}) не совпадает с H⊗H⊗H."
+
+
+def test_single_qubit_gate(verbose=True):
+    """
+    Проверяет, что apply_single_qubit_gate() совпадает с применением матрицы
+    I ⊗ X ⊗ I к произвольному состоянию трёх кубитов (гейт X на кубите 1).
+
+    Parameters:
+        verbose (bool): если True - выводит амплитуды после применения гейта.
+    """
+    x = Gate_X()
+    identity = np.eye(2, dtype=complex)
+    full = np.kron(np.kron(identity, x.gate_matrix), identity)
+    reg = QuantumRegister(3)
+    reg.state = np.arange(8, dtype=complex) / np.sqrt(140)
+    expected = full @ reg.get_state()
+    reg.apply_single_qubit_gate(x.gate_matrix, 1)
+    result = reg.get_state()
+
+    if verbose:
+        print("Результат применения X к кубиту 1:")
+        for i, a in enumerate(result):
+            print(f"  |{i:03b}>: амплитуда = {a.real:.2f} + {a.imag:.2f}j")
+
+    assert np.allclose(result, expected), "Ошибка: однокубитный гейт применён не к тому кубиту."
+
+
+def test_unitary_checks(verbose=True):
+    """
+    Проверяет проверку унитарности: skip_checks=False отклоняет неунитарную
+    матрицу (ValueError) в GenericGate и в apply_gate, а is_unitary()
+    вычисляется один раз для каждой матрицы и пересчитывается после её замены.
+
+    Parameters:
+        verbose (bool): если True - выводит число вычислений проверки.
+    """
+    non_unitary = np.ones((2, 2), dtype=complex)
+    for check in (lambda: GenericGate(non_unitary, skip_checks=False),
+                  lambda: QuantumRegister(1).apply_gate(non_unitary, skip_checks=False)):
+        try:
+            check()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Ошибка: неунитарная матрица принята при skip_checks=False.")
+
+    with mock.patch.object(np, "allclose", wraps=np.allclose) as allclose:
+        gate = Gate_H()
+        assert gate.is_unitary() and gate.is_unitary()
+        cached_calls = allclose.call_count
+        gate.gate_matrix = non_unitary
+        assert not gate.is_unitary()
+        replaced_calls = allclose.call_count
+
+        reg = QuantumRegister(1)
+        h_matrix = Gate_H().gate_matrix
+        reg.apply_gate(h_matrix, skip_checks=False)
+        reg.apply_gate(h_matrix, skip_checks=False)
+        register_calls = allclose.call_count - replaced_calls
+
+    if verbose:
+        print(f"Проверок для одной матрицы: {cached_calls}, после замены матрицы: {replaced_calls}")
+        print(f"Проверок в регистре для двух применений одной матрицы: {register_calls}")
+
+    assert cached_calls == 1, "Ошибка: is_unitary() не использует кэш для той же матрицы."
+    assert replaced_calls == 2, "Ошибка: is_unitary() не пересчитывается после замены матрицы."
+    assert register_calls == 1, "Ошибка: apply_gate() повторно проверяет ту же матрицу."
+
+
 def test_oracle_and(verbose=True):
     """
     Проверяет, что оракул OracleAND возвращает корректную диагональную матрицу,
@@ -49,6 +157,19 @@ def test_oracle_and(verbose=True):
         print(matrix)
 
     assert np.allclose(matrix, expected), "Ошибка: OracleAND неверно инвертирует |11>."
+    assert np.array_equal(oracle.get_diagonal(), np.diag(expected)), \
+        "Ошибка: диагональ OracleAND не совпадает с матрицей."
+
+    state = np.arange(1, 5, dtype=complex)
+    assert np.allclose(oracle.apply(state.copy()), expected @ state), \
+        "Ошибка: OracleAND.apply() не совпадает с умножением на матрицу."
+
+    try:
+        oracle.apply(np.ones(8, dtype=complex))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Ошибка: OracleAND применён к состоянию трёх кубитов без ошибки.")
 
 
 def test_diffusion_matrix(verbose=True):
@@ -75,6 +196,64 @@ def test_diffusion_matrix(verbose=True):
     assert np.allclose(reflected, psi), "Ошибка: оператор D искажает состояние psi."
 
 
+class WeightedDiffusion(GenericDiffusion):
+    """
+    Тестовая диффузия с неравномерным вектором psi ~ [1, 2, ..., 2^n].
+    """
+
+    def get_psi(self):
+        psi = np.arange(1, 2 ** self.n + 1, dtype=self.dtype).reshape(-1, 1)
+        return psi / np.linalg.norm(psi)
+
+
+def test_diffusion_apply(verbose=True):
+    """
+    Проверяет, что быстрое применение диффузии (инверсия относительно среднего
+    для стандартной и отражение ранга 1 для произвольного psi) совпадает
+    с умножением на плотную матрицу D.
+
+    Parameters:
+        verbose (bool): если True - выводит амплитуды состояния после отражения.
+    """
+    diffusion = StandardDiffusion(3)
+    state = np.arange(8, dtype=complex) / np.sqrt(140)
+    expected = diffusion.get_matrix() @ state
+    result = diffusion.apply(state.copy())
+
+    if verbose:
+        print("Результат инверсии относительно среднего:")
+        for i, a in enumerate(result):
+            print(f"  |{i:03b}>: амплитуда = {a.real:.2f} + {a.imag:.2f}j")
+
+    assert np.allclose(result, expected), "Ошибка: инверсия относительно среднего не совпадает с матрицей D."
+
+    weighted = WeightedDiffusion(3)
+    expected = weighted.get_matrix() @ state
+    result = weighted.apply(state.copy())
+
+    assert np.allclose(result, expected), "Ошибка: отражение ранга 1 не совпадает с матрицей D."
+
+    reg = QuantumRegister(3, dtype=np.float32)
+    reg.state[:] = state.real
+    reg.apply_operator(weighted)
+    result = reg.get_state()
+
+    assert result.dtype == np.float32, "Ошибка: отражение ранга 1 изменило тип вещественного состояния."
+    assert np.allclose(result, expected, atol=1e-6), \
+        "Ошибка: отражение ранга 1 неверно для вещественного регистра."
+
+    for mismatched in (StandardDiffusion(3), WeightedDiffusion(3)):
+        reg = QuantumRegister(2)
+        try:
+            reg.apply_operator(mismatched)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(
+                f"Ошибка: {type(mismatched).__name__} на 3 кубитах применена к регистру из 2 кубитов."
+            )
+
+
 def test_run_grover(verbose=True):
     """
     Проверяет, что алгоритм Гровера с оракулом AND успешно находит состояние |11> (x = 3)
@@ -94,3 +273,185 @@ def test_run_grover(verbose=True):
             hits += 1
 
     assert hits >= attempts * 0.8, f"Ошибка: недостаточно попаданий в |11>. Успехов: {hits}/attempts"
+
+
+class OracleEquals(GenericOracle):
+    """
+    Тестовый оракул на n кубитах для функции f(x) = [x == target].
+    """
+
+    def __init__(self, n_qubits: int, target: int):
+        super().__init__(n_qubits)
+        self.target = target
+
+    def get_function(self):
+        target = self.target
+        return lambda x: int(x == target)
+
+
+def test_run_grover_iterations(verbose=True):
+    """
+    Проверяет, что на 5 кубитах алгоритм Гровера с оптимальным числом итераций
+    floor(pi/4 * sqrt(32)) = 4 находит единственное решение x = 19.
+    Тест считается успешным, если не менее 80% измерений дают x = 19.
+
+    Parameters:
+        verbose (bool): если True - выводит каждый результат измерения.
+    """
+    hits = 0
+    attempts = 20
+    for i in range(attempts):
+        result = run_grover(OracleEquals(5, 19))
+        if verbose:
+            print(f"Измерение {i + 1}: результат = {result}")
+        if result == 19:
+            hits += 1
+
+    assert hits >= attempts * 0.8, f"Ошибка: недостаточно попаданий в x = 19. Успехов: {hits}/{attempts}"
+
+
+def test_grover_iteration(verbose=True):
+    """
+    Проверяет, что apply_grover_iteration() совпадает с плотным эталоном
+        D @ (U_f @ v)
+    на неравномерном состоянии для n = 1..6 и типов float32 и complex -
+    как объединённым ядром Numba, так и раздельным применением оракула
+    и диффузии. Также проверяется, что оракул или диффузия на другом
+    числе кубитов отклоняются.
+
+    Parameters:
+        verbose (bool): если True - выводит амплитуды после итерации для n = 3.
+    """
+    branches = [("раздельно", False)]
+    if _kernels.HAS_NUMBA:
+        branches.insert(0, ("Numba", True))
+
+    for name, use_numba in branches:
+        with mock.patch.object(_kernels, "HAS_NUMBA", use_numba):
+            for dtype in (np.float32, complex):
+                for n in range(1, 7):
+                    oracle = OracleEquals(n, (1 << n) - 2)
+                    diffusion = StandardDiffusion(n, dtype)
+                    initial = np.arange(1, 2 ** n + 1)
+                    initial = initial / np.linalg.norm(initial)
+                    expected = diffusion.get_matrix() @ (oracle.get_matrix() @ initial)
+
+                    reg = QuantumRegister(n, dtype)
+                    reg.state[:] = initial
+                    reg.apply_grover_iteration(oracle, diffusion)
+                    result = reg.get_state()
+
+                    if verbose and n == 3 and dtype is complex:
+                        print(f"Результат итерации Гровера для n = 3 ({name}):")
+                        for i, a in enumerate(result):
+                            print(f"  |{i:03b}>: амплитуда = {a.real:.2f} + {a.imag:.2f}j")
+
+                    assert result.dtype == np.dtype(dtype), \
+                        f"Ошибка: итерация Гровера ({name}) изменила тип состояния."
+                    assert np.allclose(result, expected, atol=1e-6), \
+                        f"Ошибка: итерация Гровера ({name}) для n = {n} не совпадает с D @ U_f."
+
+    mismatches = [
+        ("оракул на 4 кубитах", OracleEquals(4, 5), StandardDiffusion(3)),
+        ("диффузию на 4 кубитах", OracleEquals(3, 5), StandardDiffusion(4)),
+    ]
+    for description, oracle, diffusion in mismatches:
+        try:
+            QuantumRegister(3).apply_grover_iteration(oracle, diffusion)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Ошибка: регистр из 3 кубитов принял {description}.")
+
+
+def test_backends(verbose=True):
+    """
+    Проверяет выбор модуля массивов без GPU: backend "numpy" работает
+    в QuantumRegister и run_grover, неизвестное имя отклоняется (ValueError),
+    а "cupy" без установленного CuPy - с ImportError.
+
+    Parameters:
+        verbose (bool): если True - выводит результат run_grover на backend "numpy".
+    """
+    reg = QuantumRegister(2, backend="numpy")
+    assert reg.xp is np and isinstance(reg.get_state(), np.ndarray), \
+        "Ошибка: backend 'numpy' хранит состояние не в массиве NumPy."
+    assert _backend.get_array_module(reg.get_state()) is np
+    assert isinstance(_backend.to_numpy(reg.get_state()), np.ndarray)
+
+    result = run_grover(OracleAND(), backend="numpy")
+    if verbose:
+        print(f"run_grover(OracleAND(), backend='numpy'): результат = {result}")
+    assert result == 3, f"Ошибка: run_grover на backend 'numpy' вернул {result}."
+
+    for create in (lambda: QuantumRegister(2, backend="torch"),
+                   lambda: run_grover(OracleAND(), backend="torch")):
+        try:
+            create()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Ошибка: неизвестный backend принят без ошибки.")
+
+    with mock.patch.object(_backend, "HAS_CUPY", False):
+        try:
+            QuantumRegister(2, backend="cupy")
+        except ImportError:
+            pass
+        else:
+            raise AssertionError("Ошибка: backend 'cupy' выбран без установленного CuPy.")
+
+
+def test_measure_upper_bound(verbose=True):
+    """
+    Проверяет, что измерение не выходит за пределы регистра, когда случайное
+    число почти равно 1: для float32-состояния порог не должен округляться
+    до cdf[-1], а результат должен быть последним состоянием с ненулевой
+    вероятностью.
+
+    Parameters:
+        verbose (bool): если True - выводит результаты измерений.
+    """
+    reg = QuantumRegister(2, dtype=np.float32)
+    reg.apply_hadamard_all()
+    with mock.patch("numpy.random.random", return_value=1 - 1e-9):
+        full = reg.measure()
+
+    reg = QuantumRegister(2, dtype=np.float32)
+    reg.state[:] = [0.6, 0.8, 0, 0]
+    with mock.patch("numpy.random.random", return_value=1 - 1e-9):
+        partial = reg.measure()
+
+    if verbose:
+        print(f"Измерение равномерного состояния: результат = {full}")
+        print(f"Измерение состояния 0.6|00> + 0.8|01>: результат = {partial}")
+
+    assert full == 3, f"Ошибка: измерение вернуло индекс {full} вне диапазона 0..3."
+    assert partial == 1, f"Ошибка: измерение вернуло состояние {partial} с нулевой вероятностью."
+
+
+def test_qubit_normalization(verbose=True):
+    """
+    Проверяет, что GenericGate.apply_to не нормализует повторно результат
+    унитарного гейта (он уже нормирован), а renormalize() восстанавливает
+    норму искусственно денормализованного кубита.
+
+    Parameters:
+        verbose (bool): если True - выводит кубиты до и после нормализации.
+    """
+    base = Qubit(np.array([1, 0]))
+    with mock.patch.object(Qubit, "_normalize", autospec=True) as normalize:
+        result = Gate_H().apply_to(base)
+    assert normalize.call_count == 0, "Ошибка: apply_to() повторно нормализует результат гейта."
+    assert np.isclose(np.linalg.norm(result.get_state()), 1), \
+        "Ошибка: результат унитарного гейта не нормирован."
+
+    qubit = Qubit(np.array([3, 4]))
+    qubit.alfa_beta *= 2
+    if verbose:
+        print(f"До renormalize(): {qubit}")
+    qubit.renormalize()
+    if verbose:
+        print(f"После renormalize(): {qubit}")
+
+    assert np.allclose(qubit.get_state(), [0.6, 0.8]), "Ошибка: renormalize() не восстановил норму кубита."
@@ -21,11 +21,56 @@ try:
     test_diffusion_matrix()
     print(f"{GREEN}  Результат: Отражение работает как ожидается, Psi сохраняется.{RESET}")
 
-    print("\nТест 4: Алгоритм Гровера")
+    print("\nТест 4: Инверсия относительно среднего")
+    print("  Проверяется, что быстрое применение диффузии совпадает с умножением на матрицу D.")
+    test_diffusion_apply()
+    print(f"{GREEN}  Результат: Быстрая диффузия совпадает с матричной.{RESET}")
+
+    print("\nТест 5: Алгоритм Гровера")
     print("  Проверяется, что алгоритм Гровера возвращает состояние x = 3 (|11⟩) с высокой вероятностью.")
     test_run_grover()
     print(f"{GREEN}  Результат: Алгоритм успешно находит целевое состояние x = 3.{RESET}")
 
+    print("\nТест 6: Преобразование Уолша-Адамара")
+    print("  Проверяется, что быстрое применение H к каждому кубиту совпадает с матрицей H⊗H⊗H.")
+    test_hadamard_all()
+    print(f"{GREEN}  Результат: Преобразование Уолша-Адамара совпадает с матричным.{RESET}")
+
+    print("\nТест 7: Число итераций Гровера")
+    print("  Проверяется, что на 5 кубитах алгоритм с оптимальным числом итераций находит x = 19.")
+    test_run_grover_iterations()
+    print(f"{GREEN}  Результат: Алгоритм находит единственное решение среди 32 состояний.{RESET}")
+
+    print("\nТест 8: Однокубитный гейт без тензорного произведения")
+    print("  Проверяется, что гейт X, применённый к кубиту 1, совпадает с матрицей I⊗X⊗I.")
+    test_single_qubit_gate()
+    print(f"{GREEN}  Результат: Гейт действует на нужный кубит.{RESET}")
+
+    print("\nТест 9: Измерение на границе распределения")
+    print("  Проверяется, что измерение не возвращает индекс за пределами регистра.")
+    test_measure_upper_bound()
+    print(f"{GREEN}  Результат: Измерение всегда возвращает допустимое состояние.{RESET}")
+
+    print("\nТест 10: Объединённая итерация Гровера")
+    print("  Проверяется, что итерация одним ядром совпадает с раздельным применением оракула и диффузии.")
+    test_grover_iteration()
+    print(f"{GREEN}  Результат: Объединённая итерация совпадает с раздельной.{RESET}")
+
+    print("\nТест 11: Проверка унитарности")
+    print("  Проверяется, что неунитарная матрица отклоняется, а результат проверки кэшируется.")
+    test_unitary_checks()
+    print(f"{GREEN}  Результат: Проверка унитарности работает и не повторяется для той же матрицы.{RESET}")
+
+    print("\nТест 12: Выбор модуля массивов")
+    print("  Проверяется backend 'numpy' и ошибки для неизвестного имени и 'cupy' без CuPy.")
+    test_backends()
+    print(f"{GREEN}  Результат: Backend выбирается и проверяется корректно.{RESET}")
+
+    print("\nТест 13: Нормализация кубита")
+    print("  Проверяется, что гейт не нормализует результат повторно, а renormalize() восстанавливает норму.")
+    test_qubit_normalization()
+    print(f"{GREEN}  Результат: Нормализация выполняется только при необходимости.{RESET}")
+
     print("\nВсе тесты пройдены успешно. Алгоритм работает корректно, и реализация соответствует ожидаемому поведению квантового поиска на основе линейной алгебры.")
 
     # Анализ вероятности получения состояния |11⟩